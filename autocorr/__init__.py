@@ -4,7 +4,12 @@ from ._version import get_versions
 
 from .multitau import multitau
 from .fftautocorr import fftautocorr  # noqa
-from .cAutocorr import fftautocorr as fftautocorr_mt  # noqa
+try:
+    from .cAutocorr import fftautocorr as fftautocorr_mt
+except ImportError:
+    def fftautocorr_mt(signal):
+        warnings.warn('multithreaded c-extension is missing.', ImportWarning)
+        return fftautocorr(signal)
 try:
     from .cAutocorr import multitau_mt
 except ImportError:
@@ -24,15 +24,22 @@ def multitau(signal, lags_per_level=16):
     def even(x):
         return x if x % 2 == 0 else x - 1
 
+    # average adjacent neighbours into the scratch buffer, in place
+    def reduce_half(a, scratch, N):
+        out = scratch[:, :N // 2]
+        np.add(a[:, :N:2], a[:, 1:N:2], out=out)
+        out *= 0.5
+        return out
+
     # 1-D data hack
-    if len(signal.shape) == 1:
+    if signal.ndim == 1:
         N = even(signal.shape[0])
-        a = np.array(signal[np.newaxis, :N], copy=True)
-    elif len(signal.shape) == 2:
+        a = np.array(signal[np.newaxis, :N], dtype=np.float64)
+    elif signal.ndim == 2:
         # copy data a local array
         N = even(signal.shape[1])
-        a = np.array(signal[:, :N], copy=True)
-    elif len(signal.shape) > 2:
+        a = np.array(signal[:, :N], dtype=np.float64)
+    elif signal.ndim > 2:
         raise ValueError('Flatten the [2,3,..] dimensions before passing to autocorrelate.')
 
     if N < lags_per_level:
@@ -49,24 +56,38 @@ def multitau(signal, lags_per_level=16):
 
     # zero level
     delta_t = 1
+    # one cumulative-sum pass gives the means of every leading/trailing
+    # slice, instead of 2*m full reductions
+    s = np.cumsum(a, axis=1)
+    tau[:m] = np.arange(m) * delta_t
     for i in range(m):
-        tau[i] = i * delta_t
-        t1 = np.mean(a[:, :N - i], axis=1)
-        t2 = np.mean(a[:, i:], axis=1)
-        g2[:, i] = np.mean(a[:, :N - i] * a[:, i:], axis=1) / t1 / t2
-    a = (a[:, :N:2] + a[:, 1:N:2]) / 2
+        t1 = s[:, N - i - 1] / (N - i)
+        if i:
+            t2 = (s[:, N - 1] - s[:, i - 1]) / (N - i)
+        else:
+            t2 = s[:, N - 1] / N
+        # einsum fuses product and sum without the elementwise temporary
+        g2[:, i] = np.einsum('ij,ij->i', a[:, :N - i], a[:, i:]) \
+            / (N - i) / (t1 * t2)
+    # the halved levels ping-pong between two buffers allocated up front
+    scratch = np.empty((a.shape[0], N // 2), dtype=a.dtype)
+    a, scratch = reduce_half(a, scratch, N), a
     N = even(N // 2)
 
     for level in range(1, levels):
         delta_t *= 2
+        s = np.cumsum(a, axis=1)
+        w = a.shape[1]
+        lo = m + (level - 1) * (m // 2)
+        tau[lo:lo + m // 2] = tau[lo - 1] + delta_t * np.arange(1, m // 2 + 1)
         for n in range(m // 2):
-            idx = m + (level - 1) * (m // 2) + n
+            idx = lo + n
             shift = m // 2 + n
-            tau[idx] = tau[idx - 1] + delta_t
-            t1 = np.mean(a[:, :-shift], axis=1)
-            t2 = np.mean(a[:, shift:], axis=1)
-            g2[:, idx] = np.mean(a[:, :- shift] * a[:, shift:], axis=1) / t1 / t2
-        a = (a[:, :N:2] + a[:, 1:N:2]) / 2
+            t1 = s[:, w - shift - 1] / (w - shift)
+            t2 = (s[:, w - 1] - s[:, shift - 1]) / (w - shift)
+            g2[:, idx] = np.einsum('ij,ij->i', a[:, :-shift], a[:, shift:]) \
+                / (w - shift) / (t1 * t2)
+        a, scratch = reduce_half(a, scratch, N), a
         N = even(N // 2)
         if N < lags_per_level:
             break
@@ -0,0 +1,11 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture(scope='session')
+def signal():
+    """Decaying exponential plus noise, shared by all the test modules."""
+    N = 10240
+    rng = np.random.default_rng(0)
+    t = np.arange(N)
+    return (np.exp(-0.05 * t)[:, np.newaxis] + rng.random((N, 24)) * 0.1).T
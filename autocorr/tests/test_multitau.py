@@ -1,36 +1,30 @@
-import numpy as np
 import autocorr
 import time
 
-N = 10240
-np.random.seed(0)
-t = np.arange(N)
-A = np.exp(-0.05 * t)[:, np.newaxis] + np.random.rand(N, 24) * 0.1
 
-
-def test_multitau():
+def test_multitau(signal):
     t0 = time.time()
-    g1, tau = autocorr.multitau(A.T, 16)
+    g1, tau = autocorr.multitau(signal, 16)
     t1 = time.time()
     print('pure python time = %f' % (t1 - t0))
 
 
-def test_multitau_mt():
+def test_multitau_mt(signal):
     t0 = time.time()
-    g1, tau = autocorr.multitau_mt(A.T, 16)
+    g1, tau = autocorr.multitau_mt(signal, 16)
     t1 = time.time()
     print('accelerated version = %f' % (t1 - t0))
 
 
-def test_fftautocorr():
+def test_fftautocorr(signal):
     t0 = time.time()
-    g2, tau = autocorr.fftautocorr(A.T)
+    g2, tau = autocorr.fftautocorr(signal)
     t1 = time.time()
     print('fft version = %f' % (t1 - t0))
 
 
-def test_cfftautocorr():
+def test_cfftautocorr(signal):
     t0 = time.time()
-    g2, tau = autocorr.fftautocorr_mt(A.T)
+    g2, tau = autocorr.fftautocorr_mt(signal)
     t1 = time.time()
     print('fft version = %f' % (t1 - t0))